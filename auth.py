@@ -1,26 +1,45 @@
 #!/usr/bin/env python3
 
 import os
-import pickle
+import json
+import threading
 import yaml
 import keyring
+import httplib2
+from datetime import datetime, timezone
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 
+# Seconds before expiry at which credentials are refreshed in the background
+REFRESH_WINDOW = 300
+
 class DriveAuth:
     """Handles Google Drive API authentication and credential management."""
     
-    def __init__(self, config_path='config.yaml'):
-        """Initialize the authenticator with configuration."""
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+    def __init__(self, config_path='config.yaml', config=None):
+        """
+        Initialize the authenticator with configuration.
+        
+        Args:
+            config_path: Path to configuration file
+            config: Already-parsed configuration; config_path is not read when given
+        """
+        if config is None:
+            with open(config_path, 'r') as f:
+                config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        self.config = config
         
         self.credentials_file = self.config['google_api']['credentials_file']
         self.scopes = self.config['google_api']['scopes']
         self.keyring_service = self.config['security']['keyring_service_name']
         self.keyring_username = self.config['security']['keyring_username']
+        self.http_timeout = self.config.get('http_timeout', 30)
+
+        self._creds = None
+        self._refresh_lock = threading.Lock()
 
     def get_credentials(self):
         """
@@ -30,26 +49,24 @@ class DriveAuth:
             google.oauth2.credentials.Credentials: Valid credentials object
         
         The function will:
-        1. Check for stored credentials in keyring
-        2. If stored credentials exist and are valid, use them
-        3. If stored credentials are expired, refresh them
+        1. Reuse credentials already loaded by this instance, or check for
+           stored credentials in keyring
+        2. If the credentials are valid, use them; if they expire within
+           REFRESH_WINDOW seconds, refresh them in a background thread
+        3. If the credentials are expired, refresh them
         4. If no valid credentials exist, run the OAuth2 flow
         """
-        creds = None
-        stored_token = keyring.get_password(self.keyring_service, self.keyring_username)
-        
-        if stored_token:
-            try:
-                creds = pickle.loads(stored_token)
-            except Exception:
-                # If there's any error unpickling, treat as no credentials
-                pass
+        creds = self._creds
+        if not creds:
+            creds = self._load_stored_credentials()
 
         # If credentials don't exist or are invalid
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 try:
-                    creds.refresh(Request())
+                    with self._refresh_lock:
+                        if not creds.valid:
+                            creds.refresh(Request())
                 except Exception as e:
                     # If refresh fails, we'll need new credentials
                     creds = None
@@ -67,11 +84,114 @@ class DriveAuth:
                 creds = flow.run_local_server(port=0)
 
             # Save the credentials
-            token_pickle = pickle.dumps(creds)
-            keyring.set_password(self.keyring_service, self.keyring_username, token_pickle)
+            self._store_credentials(creds)
+        elif self._is_stale(creds):
+            self._start_background_refresh(creds)
 
+        self._creds = creds
         return creds
 
+    def refresh_if_stale(self):
+        """
+        Keep the credentials in use fresh without ever running the OAuth flow.
+        
+        Cheap enough to call before every API request, from any thread. The
+        credentials are refreshed in place, so HTTP clients built from them
+        keep working. Credentials close to expiry are refreshed in the
+        background; expired ones are refreshed inline, once, under a lock.
+        
+        Raises:
+            google.auth.exceptions.RefreshError: If an inline refresh fails
+        """
+        creds = self._creds
+        if creds is None:
+            return
+        if creds.valid:
+            if self._is_stale(creds):
+                self._start_background_refresh(creds)
+            return
+
+        with self._refresh_lock:
+            if not creds.valid:
+                creds.refresh(Request())
+                self._store_credentials(creds)
+
+    def _load_stored_credentials(self):
+        """
+        Load credentials saved in keyring.
+        
+        Returns:
+            google.oauth2.credentials.Credentials: Stored credentials, or None
+        """
+        stored_token = keyring.get_password(self.keyring_service, self.keyring_username)
+        if not stored_token:
+            return None
+
+        try:
+            return Credentials.from_authorized_user_info(
+                json.loads(stored_token), self.scopes)
+        except Exception:
+            # Unreadable tokens (including legacy pickled ones) are discarded
+            # and replaced by running the OAuth flow again
+            return None
+
+    def _store_credentials(self, creds):
+        """Save credentials to keyring."""
+        keyring.set_password(self.keyring_service, self.keyring_username, creds.to_json())
+
+    @staticmethod
+    def _is_stale(creds):
+        """Check whether still-valid credentials expire within REFRESH_WINDOW seconds."""
+        if not creds.expiry or not creds.refresh_token:
+            return False
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (creds.expiry - now).total_seconds() < REFRESH_WINDOW
+
+    def _start_background_refresh(self, creds):
+        """Refresh the given credentials in a daemon thread unless a refresh is running."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(target=self._bg_refresh, args=(creds,), daemon=True).start()
+        except Exception:
+            self._refresh_lock.release()
+            raise
+
+    def _bg_refresh(self, creds):
+        """
+        Refresh credentials and save them to keyring.
+        
+        Runs in a background thread holding the refresh lock acquired by
+        _start_background_refresh(). Errors are ignored; refresh_if_stale()
+        will refresh inline once the token has actually expired.
+        
+        Args:
+            creds: Credentials to refresh in place
+        """
+        try:
+            creds.refresh(Request())
+            self._store_credentials(creds)
+        except Exception:
+            pass
+        finally:
+            self._refresh_lock.release()
+
+    def authorized_http(self):
+        """
+        Create an HTTP client that signs requests with the current credentials.
+        
+        The client keeps its connections open between requests. httplib2.Http
+        is not thread-safe, so each thread needs its own client.
+        
+        Returns:
+            google_auth_httplib2.AuthorizedHttp: Authorized HTTP client
+        """
+        # Clients of worker threads reuse the loaded credentials rather than
+        # possibly starting the OAuth flow
+        return AuthorizedHttp(self._creds or self.get_credentials(),
+                              http=httplib2.Http(timeout=self.http_timeout))
+
     def get_service(self):
         """
         Build and return an authorized Drive API service instance.
@@ -79,8 +199,10 @@ class DriveAuth:
         Returns:
             googleapiclient.discovery.Resource: Authorized Drive API service instance
         """
-        creds = self.get_credentials()
-        service = build('drive', 'v3', credentials=creds)
+        # Use the discovery document bundled with google-api-python-client
+        # instead of downloading it on every start
+        service = build('drive', 'v3', http=self.authorized_http(),
+                        cache_discovery=False, static_discovery=True)
         return service
 
     def revoke_credentials(self):
@@ -91,13 +213,15 @@ class DriveAuth:
         stored_token = keyring.get_password(self.keyring_service, self.keyring_username)
         if stored_token:
             try:
-                creds = pickle.loads(stored_token)
+                creds = Credentials.from_authorized_user_info(
+                    json.loads(stored_token), self.scopes)
                 if creds:
                     creds.revoke(Request())
             except Exception:
                 pass  # Best effort to revoke
             finally:
                 keyring.delete_password(self.keyring_service, self.keyring_username)
+        self._creds = None
 
 def test_auth():
     """
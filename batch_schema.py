@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+from typing import List, Optional, Union
+from typing_extensions import Annotated, Literal
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
+
+class CopyCommand(BaseModel):
+    """Copy a shared file/folder to a destination folder."""
+
+    action: Literal['copy']
+    source: str
+    destination: Optional[str] = None
+    description: str = ''
+
+class RenameCommand(BaseModel):
+    """Add a prefix and/or suffix to items matching a pattern."""
+
+    action: Literal['rename']
+    folder_id: str
+    target: str
+    prefix: Optional[str] = None
+    suffix: Optional[str] = None
+    description: str = ''
+
+    @model_validator(mode='after')
+    def check_prefix_or_suffix(self) -> 'RenameCommand':
+        """Require at least one of prefix and suffix."""
+        if not self.prefix and not self.suffix:
+            raise ValueError("Either prefix or suffix must be specified")
+        return self
+
+class DeleteCommand(BaseModel):
+    """Delete items matching a pattern."""
+
+    action: Literal['delete']
+    folder_id: str
+    pattern: str
+    description: str = ''
+
+class CopyToSubfoldersCommand(BaseModel):
+    """Copy a file to all subfolders of a folder."""
+
+    action: Literal['copy_to_subfolders']
+    source_id: str
+    folder_id: str
+    description: str = ''
+
+Command = Annotated[
+    Union[CopyCommand, RenameCommand, DeleteCommand, CopyToSubfoldersCommand],
+    Field(discriminator='action')
+]
+
+class BatchFile(BaseModel):
+    """Contents of a batch commands file."""
+
+    commands: List[Command] = []
+
+command_adapter = TypeAdapter(Command)
@@ -1,42 +1,164 @@
 #!/usr/bin/env python3
 
 import os
+import json
 import time
-from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime
+import random
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed, wait
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import diskcache
 from tqdm import tqdm
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 
 from auth import DriveAuth
-from utilities import DriveUtilities
+from batch_schema import (Command, CopyCommand, RenameCommand, DeleteCommand,
+                          CopyToSubfoldersCommand, command_adapter)
+from utilities import DriveUtilities, compile_pattern, extract_file_id_from_url
+
+# Maximum number of sub-requests the Drive API accepts in one batch HTTP call
+BATCH_LIMIT = 100
+
+# Status codes and 403 error reasons that are retried with backoff
+RETRYABLE_STATUSES = {429, 500, 503}
+RATE_LIMIT_REASONS = {'userRateLimitExceeded', 'rateLimitExceeded'}
+
+# Upper bound in seconds for a single computed backoff
+MAX_BACKOFF = 64
+
+class RateLimiter:
+    """Spaces out calls so that at most `rate` slots are used per second across threads."""
+
+    def __init__(self, rate: float):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rate: Maximum calls per second (0 or less disables limiting)
+        """
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, n: int = 1) -> None:
+        """
+        Block until the next call slot is available.
+        
+        Args:
+            n: Number of slots the call uses, e.g. the sub-requests of a batch
+        """
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + n * self.interval
+        if slot > now:
+            time.sleep(slot - now)
 
 class DriveManager:
     """Manages Google Drive operations including file transfers and batch modifications."""
 
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: str = 'config.yaml',
+                 config: Optional[Dict[str, Any]] = None,
+                 utils: Optional[DriveUtilities] = None,
+                 logger: Optional[logging.Logger] = None):
         """
         Initialize DriveManager with configuration.
         
         Args:
             config_path: Path to configuration file
+            config: Already-parsed configuration; config_path is not read when given
+            utils: Shared DriveUtilities instance (created if not given)
+            logger: Shared logger (set up from the configuration if not given)
         """
-        self.auth = DriveAuth(config_path)
+        self.auth = DriveAuth(config_path, config=config)
         self.service = self.auth.get_service()
-        self.utils = DriveUtilities()
-        self.logger = self.utils.setup_logging(self.auth.config)
+        self.utils = utils or DriveUtilities()
+        self.logger = logger or self.utils.setup_logging(self.auth.config)
         self.config = self.auth.config
-        self.batch_size = self.config['batch_size']
+        self.batch_size = min(self.config['batch_size'], BATCH_LIMIT)
+        self.list_page_size = self.config.get('list_page_size', 1000)
         self.max_retries = self.config['max_retries']
         self.retry_delay = self.config['retry_delay']
 
-    def _execute_with_retry(self, request: Any) -> Dict:
+        # Per-item success messages are only shown at INFO when requested
+        verbose_per_item = self.config.get('logging', {}).get('verbose_per_item', False)
+        self.per_item_log_level = logging.INFO if verbose_per_item else logging.DEBUG
+
+        self._command_handlers = {
+            'copy': self._do_copy,
+            'rename': self._do_rename,
+            'delete': self._do_delete,
+            'copy_to_subfolders': self._do_copy_to_subfolders
+        }
+        self._meta_cache: Dict[str, Dict] = {}
+        self._disk_cache = diskcache.Cache(
+            os.path.expanduser(self.config.get('cache_dir', '~/.cache/gdrive_tool')))
+        # The cache directory is shared, so entries are keyed by account as well
+        self._cache_account = (self.auth.keyring_service, self.auth.keyring_username)
+        self.meta_ttl = self.config.get('meta_ttl', 60)
+
+        # Drive allows roughly 10 requests per second per user
+        self._pool = ThreadPoolExecutor(max_workers=self.config.get('max_workers', 10))
+        self._rate_limiter = RateLimiter(self.config.get('max_requests_per_second', 10))
+        self._local = threading.local()
+
+    def _thread_http(self) -> AuthorizedHttp:
+        """
+        Get the HTTP client for the current thread.
+        
+        Each thread reuses one client, and with it the open connections, for
+        all of its requests.
+        
+        Returns:
+            AuthorizedHttp: HTTP client bound to the current credentials
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self.auth.authorized_http()
+            self._local.http = http
+        return http
+
+    @staticmethod
+    def _wait_for(futures: List[Future]) -> None:
+        """
+        Wait for submitted tasks, cancelling the rest if any of them fails.
+        
+        Tasks that have already started are waited for before the error is
+        raised, so every change they make has been reported through their
+        callbacks by the time the caller sees it.
+        
+        Args:
+            futures: Futures returned by the thread pool
+            
+        Raises:
+            Exception: The first exception raised by a task
+        """
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            raise
+
+    def _execute_with_retry(self, request: Any, cost: int = 1) -> Dict:
         """
         Execute a Google Drive API request with exponential backoff retry logic.
         
         Args:
             request: Google Drive API request object
+            cost: Number of rate limiter slots the request uses; Drive counts
+                every sub-request of a batch against the quota
             
         Returns:
             Dict: API response
@@ -45,19 +167,123 @@ class DriveManager:
             HttpError: If request fails after all retries
         """
         retry_count = 0
-        while retry_count < self.max_retries:
+        while True:
+            # Cheap when the cached token is valid; starts a background refresh near
+            # expiry and never runs the interactive OAuth flow from a worker thread
+            self.auth.refresh_if_stale()
+            self._rate_limiter.acquire(cost)
             try:
-                return request.execute()
+                return request.execute(http=self._thread_http())
             except HttpError as error:
-                if error.resp.status in [429, 500, 503]:  # Rate limit or server errors
-                    retry_count += 1
-                    if retry_count == self.max_retries:
-                        raise
-                    wait_time = (2 ** retry_count) * self.retry_delay
-                    self.logger.warning(f"Request failed, retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
+                if not self._is_retryable(error):
                     raise
+                retry_count += 1
+                if retry_count >= self.max_retries:
+                    raise
+                wait_time = self._backoff_delay(error, retry_count)
+                self.logger.warning(f"Request failed, retrying in {wait_time:.2f} seconds...")
+                time.sleep(wait_time)
+
+    @staticmethod
+    def _is_retryable(error: HttpError) -> bool:
+        """
+        Check whether an API error is a rate limit or transient server error.
+        
+        Args:
+            error: Error raised by the Google Drive API
+            
+        Returns:
+            bool: True if the request should be retried
+        """
+        status = error.resp.status
+        if status in RETRYABLE_STATUSES:
+            return True
+        if status != 403:
+            return False
+
+        try:
+            reason = json.loads(error.content)['error']['errors'][0]['reason']
+        except (ValueError, KeyError, IndexError, TypeError):
+            return False
+        return reason in RATE_LIMIT_REASONS
+
+    def _backoff_delay(self, error: HttpError, retry_count: int) -> float:
+        """
+        Compute how long to wait before retrying a failed request.
+        
+        Honors the server's Retry-After header when present, otherwise uses
+        exponential backoff with full jitter.
+        
+        Args:
+            error: Error raised by the Google Drive API
+            retry_count: Number of failed attempts so far
+            
+        Returns:
+            float: Delay in seconds
+        """
+        retry_after = error.resp.get('retry-after')
+        if retry_after:
+            try:
+                return max(0.0, float(int(retry_after)))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+                except (TypeError, ValueError):
+                    pass
+
+        return random.uniform(0, min((2 ** retry_count) * self.retry_delay, MAX_BACKOFF))
+
+    def _batch_execute(self, requests: List[Any],
+                       callback: Callable[[str, Any, Optional[HttpError]], None]) -> None:
+        """
+        Execute API requests as batch HTTP calls of up to batch_size sub-requests each.
+        
+        Sub-requests that fail with a rate limit or transient server error are
+        resent in a new batch after a backoff, up to max_retries attempts; only
+        the final outcome of each request is passed to the callback.
+        
+        Args:
+            requests: Prepared Google Drive API request objects
+            callback: Called as callback(request_id, response, exception) for every
+                sub-request; request_id is the index of the request in `requests`
+        """
+        # Batches run concurrently, but callbacks are serialized for the caller
+        lock = threading.Lock()
+
+        def run_batch(indices: List[int]) -> None:
+            attempt = 0
+            while indices:
+                retry = []
+
+                def on_response(request_id: str, response: Any,
+                                exception: Optional[HttpError]) -> None:
+                    if (isinstance(exception, HttpError) and self._is_retryable(exception)
+                            and attempt + 1 < self.max_retries):
+                        retry.append((int(request_id), exception))
+                        return
+                    with lock:
+                        callback(request_id, response, exception)
+
+                batch = self.service.new_batch_http_request(callback=on_response)
+                for index in indices:
+                    batch.add(requests[index], request_id=str(index))
+                self._execute_with_retry(batch, cost=len(indices))
+
+                if not retry:
+                    return
+                attempt += 1
+                wait_time = max(self._backoff_delay(error, attempt) for _, error in retry)
+                self.logger.warning(
+                    f"{len(retry)} batched requests failed, retrying in {wait_time:.2f} seconds...")
+                time.sleep(wait_time)
+                indices = [index for index, _ in retry]
+
+        futures = []
+        for start in range(0, len(requests), self.batch_size):
+            indices = list(range(start, min(start + self.batch_size, len(requests))))
+            futures.append(self._pool.submit(run_batch, indices))
+        self._wait_for(futures)
 
     def parse_shared_link(self, url: str) -> str:
         """
@@ -72,7 +298,7 @@ class DriveManager:
         Raises:
             ValueError: If URL is invalid or ID cannot be extracted
         """
-        file_id = self.utils.extract_file_id_from_url(url)
+        file_id = extract_file_id_from_url(url)
         if not file_id:
             raise ValueError("Invalid Google Drive URL or could not extract file ID")
         return file_id
@@ -81,25 +307,49 @@ class DriveManager:
         """
         Get metadata for a file/folder.
         
+        Results are cached for the lifetime of the manager, and on disk for
+        meta_ttl seconds so that later runs can reuse them.
+        
         Args:
             file_id: Google Drive file/folder ID
             
         Returns:
             Dict: File metadata
         """
+        cached = self._meta_cache.get(file_id)
+        if cached is None:
+            cached = self._disk_cache.get(self._cache_account + (file_id,))
+        if cached is not None:
+            self._meta_cache[file_id] = cached
+            return cached
+
         try:
-            return self._execute_with_retry(
+            metadata = self._execute_with_retry(
                 self.service.files().get(
                     fileId=file_id,
                     fields='id, name, mimeType, parents, size, modifiedTime'
                 )
             )
+            self._meta_cache[file_id] = metadata
+            self._disk_cache.set(self._cache_account + (file_id,), metadata,
+                                 expire=self.meta_ttl)
+            return metadata
         except HttpError as error:
             self.logger.error(f"Error getting file metadata: {error}")
             raise
 
+    def _invalidate_metadata(self, file_id: str) -> None:
+        """
+        Drop cached metadata for an item that has been modified.
+        
+        Args:
+            file_id: Google Drive file/folder ID
+        """
+        self._meta_cache.pop(file_id, None)
+        self._disk_cache.delete(self._cache_account + (file_id,))
+
     def copy_drive_item(self, item_id: str, destination_folder_id: Optional[str] = None,
-                       new_name: Optional[str] = None) -> str:
+                       new_name: Optional[str] = None, known_mime: Optional[str] = None) -> str:
         """
         Copy a file or folder to the specified destination.
         
@@ -107,13 +357,14 @@ class DriveManager:
             item_id: ID of the item to copy
             destination_folder_id: ID of destination folder (None for root)
             new_name: New name for the copied item (None to keep original)
+            known_mime: MIME type of the item if already known, skips the metadata lookup
             
         Returns:
             str: ID of the copied item
         """
         try:
-            metadata = self.get_file_metadata(item_id)
-            is_folder = metadata['mimeType'] == 'application/vnd.google-apps.folder'
+            mime_type = known_mime or self.get_file_metadata(item_id)['mimeType']
+            is_folder = mime_type == 'application/vnd.google-apps.folder'
 
             if is_folder:
                 return self._copy_folder(item_id, destination_folder_id, new_name)
@@ -143,7 +394,8 @@ class DriveManager:
         copied_file = self._execute_with_retry(
             self.service.files().copy(
                 fileId=file_id,
-                body=body
+                body=body,
+                fields='id'
             )
         )
         return copied_file['id']
@@ -153,6 +405,10 @@ class DriveManager:
         """
         Copy a folder and its contents recursively.
         
+        The tree is walked breadth-first from a worklist, so its depth does not
+        grow the call stack. Each folder is created from this thread and its
+        files are then copied with batch requests.
+        
         Args:
             folder_id: ID of the folder to copy
             parent_id: ID of the parent folder
@@ -160,56 +416,139 @@ class DriveManager:
             
         Returns:
             str: ID of the copied folder
+            
+        Raises:
+            ValueError: If folder_id is not a folder (e.g. a wrong type hint)
         """
-        # Create the new folder
-        folder_metadata = self.get_file_metadata(folder_id)
-        new_folder = {
-            'name': new_name or folder_metadata['name'],
-            'mimeType': 'application/vnd.google-apps.folder'
-        }
-        if parent_id:
-            new_folder['parents'] = [parent_id]
+        root_items = None
+        if new_name is None:
+            folder_metadata = self.get_file_metadata(folder_id)
+            if folder_metadata['mimeType'] != 'application/vnd.google-apps.folder':
+                raise ValueError(f"{folder_id} is not a folder")
+            new_name = folder_metadata['name']
+        else:
+            # Without a metadata lookup, a file passed as a folder only shows up
+            # as an item without children, so confirm the type in that case
+            root_items = list(self.iter_folder_contents(folder_id))
+            if (not root_items and self.get_file_metadata(folder_id)['mimeType']
+                    != 'application/vnd.google-apps.folder'):
+                raise ValueError(f"{folder_id} is not a folder")
+
+        # Worklist of (source folder, destination parent, name, listed children)
+        queue = deque([(folder_id, parent_id, new_name, root_items)])
+        root_folder_id = None
+        errors = []
+
+        with tqdm(total=0, desc=f"Copying folder: {new_name}") as progress:
+            def on_copied(request_id: str, response: Any, exception: Optional[HttpError]) -> None:
+                if exception is not None:
+                    errors.append(exception)
+                progress.update(1)
+
+            while queue:
+                source_id, dest_parent_id, name, items = queue.popleft()
+
+                # Create the new folder
+                new_folder = {
+                    'name': name,
+                    'mimeType': 'application/vnd.google-apps.folder'
+                }
+                if dest_parent_id:
+                    new_folder['parents'] = [dest_parent_id]
+
+                created_folder = self._execute_with_retry(
+                    self.service.files().create(body=new_folder, fields='id')
+                )
+                new_folder_id = created_folder['id']
+                if root_folder_id is None:
+                    root_folder_id = new_folder_id
+                else:
+                    progress.update(1)
+
+                # Queue subfolders and copy files
+                requests = []
+                if items is None:
+                    items = self.iter_folder_contents(source_id)
+                for item in items:
+                    progress.total += 1
+                    if item['mimeType'] == 'application/vnd.google-apps.folder':
+                        queue.append((item['id'], new_folder_id, item['name'], None))
+                    else:
+                        requests.append(
+                            self.service.files().copy(
+                                fileId=item['id'],
+                                body={'parents': [new_folder_id]},
+                                fields='id'
+                            )
+                        )
+                progress.refresh()
 
-        created_folder = self._execute_with_retry(
-            self.service.files().create(body=new_folder)
-        )
-        new_folder_id = created_folder['id']
+                self._batch_execute(requests, on_copied)
+                if errors:
+                    raise errors[0]
 
-        # List and copy all items in the folder
-        items = self.list_folder_contents(folder_id)
-        for item in tqdm(items, desc=f"Copying folder: {folder_metadata['name']}"):
-            self.copy_drive_item(item['id'], new_folder_id)
+        return root_folder_id
 
-        return new_folder_id
+    @staticmethod
+    def _parents_query(folder_id: str, mime_type: Optional[str] = None) -> str:
+        """
+        Build a files.list query selecting the children of a folder.
+        
+        Args:
+            folder_id: ID of the parent folder
+            mime_type: Only select children with this MIME type
+            
+        Returns:
+            str: Drive search query with all values escaped
+        """
+        def quote(value: str) -> str:
+            return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+        query = f"{quote(folder_id)} in parents"
+        if mime_type:
+            query += f" and mimeType={quote(mime_type)}"
+        return query
 
-    def list_folder_contents(self, folder_id: str) -> List[Dict]:
+    def iter_folder_contents(self, folder_id: str,
+                             mime_type: Optional[str] = None) -> Iterator[Dict]:
         """
-        List all items in a folder.
+        Iterate over all items in a folder, fetching pages as they are consumed.
         
         Args:
             folder_id: ID of the folder
+            mime_type: Only list items with this MIME type
             
-        Returns:
-            List[Dict]: List of items in the folder
+        Yields:
+            Dict: Item in the folder
         """
-        items = []
         page_token = None
 
         while True:
             results = self._execute_with_retry(
                 self.service.files().list(
-                    q=f"'{folder_id}' in parents",
-                    pageSize=self.batch_size,
+                    q=self._parents_query(folder_id, mime_type),
+                    pageSize=self.list_page_size,
                     pageToken=page_token,
                     fields="nextPageToken, files(id, name, mimeType)"
                 )
             )
-            items.extend(results.get('files', []))
+            yield from results.get('files', [])
             page_token = results.get('nextPageToken')
             if not page_token:
                 break
 
-        return items
+    def list_folder_contents(self, folder_id: str, mime_type: Optional[str] = None) -> List[Dict]:
+        """
+        List all items in a folder.
+        
+        Args:
+            folder_id: ID of the folder
+            mime_type: Only list items with this MIME type
+            
+        Returns:
+            List[Dict]: List of items in the folder
+        """
+        return list(self.iter_folder_contents(folder_id, mime_type))
 
     def batch_rename(self, folder_id: str, pattern: str, prefix: Optional[str] = None,
                     suffix: Optional[str] = None) -> List[Tuple[str, str]]:
@@ -229,24 +568,40 @@ class DriveManager:
             raise ValueError("Either prefix or suffix must be specified")
 
         renamed_items = []
-        items = self.list_folder_contents(folder_id)
-
-        for item in tqdm(items, desc="Renaming items"):
-            if self.utils.pattern_matches(item['name'], pattern):
+        targets = []
+        requests = []
+        regex = compile_pattern(pattern)
+        for item in self.iter_folder_contents(folder_id):
+            if regex.fullmatch(item['name']):
                 name, ext = os.path.splitext(item['name'])
                 new_name = f"{prefix or ''}{name}{suffix or ''}{ext}"
-                
-                try:
-                    self._execute_with_retry(
-                        self.service.files().update(
-                            fileId=item['id'],
-                            body={'name': new_name}
-                        )
+                targets.append((item['id'], item['name'], new_name))
+                requests.append(
+                    self.service.files().update(
+                        fileId=item['id'],
+                        body={'name': new_name},
+                        fields='id'
                     )
-                    renamed_items.append((item['name'], new_name))
-                    self.logger.info(f"Renamed: {item['name']} -> {new_name}")
-                except HttpError as e:
-                    self.logger.error(f"Error renaming {item['name']}: {e}")
+                )
+
+        progress = tqdm(total=len(requests), desc="Renaming items")
+
+        def on_renamed(request_id: str, response: Any, exception: Optional[HttpError]) -> None:
+            item_id, old_name, new_name = targets[int(request_id)]
+            if exception is None:
+                self._invalidate_metadata(item_id)
+                renamed_items.append((old_name, new_name))
+                self.logger.log(self.per_item_log_level, f"Renamed: {old_name} -> {new_name}")
+            else:
+                self.logger.error(f"Error renaming {old_name}: {exception}")
+            progress.update(1)
+
+        try:
+            self._batch_execute(requests, on_renamed)
+        finally:
+            progress.close()
+
+        self.logger.info(f"Renamed {len(renamed_items)} items in {folder_id}")
 
         return renamed_items
 
@@ -262,18 +617,32 @@ class DriveManager:
             List[str]: Names of deleted items
         """
         deleted_items = []
-        items = self.list_folder_contents(folder_id)
+        targets = []
+        requests = []
+        regex = compile_pattern(pattern)
+        for item in self.iter_folder_contents(folder_id):
+            if regex.fullmatch(item['name']):
+                targets.append((item['id'], item['name']))
+                requests.append(self.service.files().delete(fileId=item['id']))
+
+        progress = tqdm(total=len(requests), desc="Deleting items")
+
+        def on_deleted(request_id: str, response: Any, exception: Optional[HttpError]) -> None:
+            item_id, name = targets[int(request_id)]
+            if exception is None:
+                self._invalidate_metadata(item_id)
+                deleted_items.append(name)
+                self.logger.log(self.per_item_log_level, f"Deleted: {name}")
+            else:
+                self.logger.error(f"Error deleting {name}: {exception}")
+            progress.update(1)
 
-        for item in tqdm(items, desc="Deleting items"):
-            if self.utils.pattern_matches(item['name'], pattern):
-                try:
-                    self._execute_with_retry(
-                        self.service.files().delete(fileId=item['id'])
-                    )
-                    deleted_items.append(item['name'])
-                    self.logger.info(f"Deleted: {item['name']}")
-                except HttpError as e:
-                    self.logger.error(f"Error deleting {item['name']}: {e}")
+        try:
+            self._batch_execute(requests, on_deleted)
+        finally:
+            progress.close()
+
+        self.logger.info(f"Deleted {len(deleted_items)} items in {folder_id}")
 
         return deleted_items
 
@@ -289,74 +658,75 @@ class DriveManager:
             List[str]: IDs of created copies
         """
         copied_files = []
-        subfolders = self._execute_with_retry(
-            self.service.files().list(
-                q=f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.folder'",
-                fields="files(id, name)"
-            )
-        ).get('files', [])
+        subfolders = self.list_folder_contents(folder_id, 'application/vnd.google-apps.folder')
 
         source_metadata = self.get_file_metadata(source_file_id)
-        for folder in tqdm(subfolders, desc=f"Copying {source_metadata['name']} to subfolders"):
+        desc = f"Copying {source_metadata['name']} to subfolders"
+
+        if source_metadata['mimeType'] == 'application/vnd.google-apps.folder':
+            # Folder copies need a create + recursive copy per destination
+            for folder in tqdm(subfolders, desc=desc):
+                try:
+                    copied_id = self.copy_drive_item(
+                        source_file_id, folder['id'], known_mime=source_metadata['mimeType'])
+                    copied_files.append(copied_id)
+                    self.logger.log(self.per_item_log_level, f"Copied to folder {folder['name']}")
+                except Exception as e:
+                    self.logger.error(f"Error copying to folder {folder['name']}: {e}")
+        else:
+            requests = [
+                self.service.files().copy(
+                    fileId=source_file_id,
+                    body={'parents': [folder['id']]},
+                    fields='id'
+                )
+                for folder in subfolders
+            ]
+            progress = tqdm(total=len(requests), desc=desc)
+
+            def on_copied(request_id: str, response: Any, exception: Optional[HttpError]) -> None:
+                folder = subfolders[int(request_id)]
+                if exception is None:
+                    copied_files.append(response['id'])
+                    self.logger.log(self.per_item_log_level, f"Copied to folder {folder['name']}")
+                else:
+                    self.logger.error(f"Error copying to folder {folder['name']}: {exception}")
+                progress.update(1)
+
             try:
-                copied_id = self.copy_drive_item(source_file_id, folder['id'])
-                copied_files.append(copied_id)
-                self.logger.info(f"Copied to folder {folder['name']}")
-            except Exception as e:
-                self.logger.error(f"Error copying to folder {folder['name']}: {e}")
+                self._batch_execute(requests, on_copied)
+            finally:
+                progress.close()
 
+        self.logger.info(
+            f"Copied {source_metadata['name']} to {len(copied_files)} subfolders of {folder_id}")
         return copied_files
 
-    def execute_batch_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
+    def execute_batch_command(self, command: Union[Command, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Execute a batch command from batch_commands.json.
         
         Args:
-            command: Command dictionary with action and parameters
+            command: Validated command, or a raw command dictionary with action
+                and parameters
             
         Returns:
             Dict[str, Any]: Result of the command execution
+            
+        Raises:
+            ValueError: If a raw command dictionary is invalid
         """
-        action = command.get('action')
-        if not action:
-            raise ValueError("Command must specify an 'action'")
+        if isinstance(command, dict):
+            command = command_adapter.validate_python(command)
 
         result = {
-            'action': action,
+            'action': command.action,
             'status': 'success',
             'details': {}
         }
 
         try:
-            if action == 'copy':
-                source_id = self.parse_shared_link(command['source'])
-                dest_id = command.get('destination')
-                new_id = self.copy_drive_item(source_id, dest_id)
-                result['details']['new_id'] = new_id
-
-            elif action == 'rename':
-                folder_id = command['folder_id']
-                pattern = command['target']
-                prefix = command.get('prefix')
-                suffix = command.get('suffix')
-                renamed = self.batch_rename(folder_id, pattern, prefix, suffix)
-                result['details']['renamed_items'] = renamed
-
-            elif action == 'delete':
-                folder_id = command['folder_id']
-                pattern = command['pattern']
-                deleted = self.delete_items(folder_id, pattern)
-                result['details']['deleted_items'] = deleted
-
-            elif action == 'copy_to_subfolders':
-                source_id = command['source_id']
-                folder_id = command['folder_id']
-                copied = self.copy_to_subfolders(source_id, folder_id)
-                result['details']['copied_files'] = copied
-
-            else:
-                raise ValueError(f"Unknown action: {action}")
-
+            result['details'] = self._command_handlers[command.action](command)
         except Exception as e:
             result['status'] = 'error'
             result['error'] = str(e)
@@ -364,6 +734,28 @@ class DriveManager:
 
         return result
 
+    def _do_copy(self, command: CopyCommand) -> Dict[str, Any]:
+        """Run a 'copy' batch command."""
+        source_id = self.parse_shared_link(command.source)
+        new_id = self.copy_drive_item(source_id, command.destination)
+        return {'new_id': new_id}
+
+    def _do_rename(self, command: RenameCommand) -> Dict[str, Any]:
+        """Run a 'rename' batch command."""
+        renamed = self.batch_rename(command.folder_id, command.target,
+                                    command.prefix, command.suffix)
+        return {'renamed_items': renamed}
+
+    def _do_delete(self, command: DeleteCommand) -> Dict[str, Any]:
+        """Run a 'delete' batch command."""
+        deleted = self.delete_items(command.folder_id, command.pattern)
+        return {'deleted_items': deleted}
+
+    def _do_copy_to_subfolders(self, command: CopyToSubfoldersCommand) -> Dict[str, Any]:
+        """Run a 'copy_to_subfolders' batch command."""
+        copied = self.copy_to_subfolders(command.source_id, command.folder_id)
+        return {'copied_files': copied}
+
 if __name__ == "__main__":
     # Example usage
     manager = DriveManager()
@@ -8,9 +8,24 @@ import yaml
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+from pydantic import ValidationError
+
+from batch_schema import BatchFile
 from drive_manager import DriveManager
 from utilities import DriveUtilities
 
+# MIME types passed to copy_drive_item for the --type hint; only the folder
+# type is checked, so any other type selects a plain file copy
+ITEM_TYPE_MIME_TYPES = {
+    'file': 'application/octet-stream',
+    'folder': 'application/vnd.google-apps.folder'
+}
+
 class GDriveTool:
     """Command-line interface for Google Drive automation tool."""
 
@@ -22,14 +37,15 @@ class GDriveTool:
         # Load configuration
         try:
             with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+                self.config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         except Exception as e:
             sys.exit(f"Error loading configuration: {e}")
 
         # Initialize utilities and drive manager
         self.utils = DriveUtilities()
         self.logger = self.utils.setup_logging(self.config)
-        self.drive_manager = DriveManager(self.config_path)
+        self.drive_manager = DriveManager(self.config_path, config=self.config,
+                                          utils=self.utils, logger=self.logger)
 
     def setup_argparse(self) -> argparse.ArgumentParser:
         """
@@ -50,6 +66,8 @@ class GDriveTool:
         copy_parser.add_argument('--url', required=True, help='Shared Google Drive URL')
         copy_parser.add_argument('--destination', help='Destination folder ID (optional)')
         copy_parser.add_argument('--new-name', help='New name for the copied item (optional)')
+        copy_parser.add_argument('--type', choices=ITEM_TYPE_MIME_TYPES,
+            help='Type of the shared item (optional); skips looking it up where possible')
 
         # Modify command
         modify_parser = subparsers.add_parser('modify', help='Batch modify files/folders')
@@ -89,7 +107,8 @@ class GDriveTool:
             new_id = self.drive_manager.copy_drive_item(
                 file_id, 
                 args.destination, 
-                args.new_name
+                args.new_name,
+                known_mime=ITEM_TYPE_MIME_TYPES.get(args.type)
             )
             self.logger.info(f"Successfully copied. New item ID: {new_id}")
         except Exception as e:
@@ -121,7 +140,8 @@ class GDriveTool:
             
             self.logger.info(f"Successfully renamed {len(renamed)} items")
             for old_name, new_name in renamed:
-                self.logger.info(f"Renamed: {old_name} -> {new_name}")
+                self.logger.log(self.drive_manager.per_item_log_level,
+                                f"Renamed: {old_name} -> {new_name}")
         except Exception as e:
             self.logger.error(f"Modify operation failed: {e}")
             sys.exit(1)
@@ -146,7 +166,7 @@ class GDriveTool:
             
             self.logger.info(f"Successfully deleted {len(deleted)} items")
             for item in deleted:
-                self.logger.info(f"Deleted: {item}")
+                self.logger.log(self.drive_manager.per_item_log_level, f"Deleted: {item}")
         except Exception as e:
             self.logger.error(f"Delete operation failed: {e}")
             sys.exit(1)
@@ -171,7 +191,8 @@ class GDriveTool:
             
             self.logger.info(f"Successfully copied to {len(copied)} subfolders")
             for copy_id in copied:
-                self.logger.info(f"Created copy with ID: {copy_id}")
+                self.logger.log(self.drive_manager.per_item_log_level,
+                                f"Created copy with ID: {copy_id}")
         except Exception as e:
             self.logger.error(f"Copy to subfolders operation failed: {e}")
             sys.exit(1)
@@ -186,27 +207,38 @@ class GDriveTool:
         batch_file = args.file or self.batch_commands_path
         
         try:
-            with open(batch_file, 'r') as f:
-                commands = json.load(f)
+            if orjson:
+                with open(batch_file, 'rb') as f:
+                    commands = orjson.loads(f.read())
+            else:
+                with open(batch_file, 'r') as f:
+                    commands = json.load(f)
         except Exception as e:
             self.logger.error(f"Error loading batch commands file: {e}")
             sys.exit(1)
 
+        # Validate every command before making any API calls
+        try:
+            batch = BatchFile.model_validate(commands)
+        except ValidationError as e:
+            self.logger.error(f"Invalid batch commands file {batch_file}:\n{e}")
+            sys.exit(1)
+
         results = []
-        for cmd in commands.get('commands', []):
+        for cmd in batch.commands:
             try:
-                self.logger.info(f"Executing batch command: {cmd.get('action')}")
+                self.logger.info(f"Executing batch command: {cmd.action}")
                 result = self.drive_manager.execute_batch_command(cmd)
                 results.append(result)
                 
                 if result['status'] == 'success':
-                    self.logger.info(f"Command completed successfully: {cmd.get('description', '')}")
+                    self.logger.info(f"Command completed successfully: {cmd.description}")
                 else:
                     self.logger.error(f"Command failed: {result.get('error')}")
             except Exception as e:
                 self.logger.error(f"Error executing batch command: {e}")
                 results.append({
-                    'action': cmd.get('action'),
+                    'action': cmd.action,
                     'status': 'error',
                     'error': str(e)
                 })
@@ -215,8 +247,12 @@ class GDriveTool:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         report_file = f'batch_report_{timestamp}.json'
         try:
-            with open(report_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            if orjson:
+                with open(report_file, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(report_file, 'w') as f:
+                    json.dump(results, f, indent=2)
             self.logger.info(f"Batch execution report saved to: {report_file}")
         except Exception as e:
             self.logger.error(f"Error saving batch report: {e}")
@@ -1,270 +1,541 @@
 #!/usr/bin/env python3
 
 import os
+import time
 import re
+import mmap
 import hashlib
+import functools
 import fnmatch
+import mimetypes
+import queue
+import atexit
 import logging
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from urllib.parse import urlparse, parse_qs
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Pattern, Union
 
-class DriveUtilities:
-    """Utility functions for Google Drive operations."""
+try:
+    import google_crc32c
+except ImportError:  # Only needed for CRC32C checksums
+    google_crc32c = None
+
+# File/folder ID in a Drive URL. Every alternative scans from the start of the
+# URL, so the first alternative that matches anywhere wins, in this order of
+# preference: /file/d/<id>, /folders/<id>, ?id=<id> or &id=<id>, /drive/<id>
+_URL_ID_RE = re.compile(
+    r'.*?/file/d/([a-zA-Z0-9_-]+)'
+    r'|.*?/folders/([a-zA-Z0-9_-]+)'
+    r'|.*?[?&]id=([a-zA-Z0-9_-]+)'
+    r'|.*?/drive/([a-zA-Z0-9_-]+)',
+    re.DOTALL
+)
+
+# Literal text that every _URL_ID_RE match contains
+_URL_MARKERS = ('/file/d/', '/folders/', 'id=', '/drive/')
+
+_SCHEDULE_RE = re.compile(r'(\d+)([smhdw])')
+
+# Seconds per schedule unit
+_SCHEDULE_UNITS = MappingProxyType({
+    's': 1,
+    'm': 60,
+    'h': 3600,
+    'd': 86400,
+    'w': 604800
+})
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Project-specific MIME types by lowercase file extension; these take precedence
+# over the stdlib mimetypes defaults
+_MIME_MAP = MappingProxyType({
+    '.txt': 'text/plain',
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.xls': 'application/vnd.ms-excel',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.ppt': 'application/vnd.ms-powerpoint',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.zip': 'application/zip',
+    '.mp3': 'audio/mpeg',
+    '.mp4': 'video/mp4',
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript'
+})
+
+# Built-in mimetypes table, independent of the system's mime.types files
+_MIME_TYPES = mimetypes.MimeTypes()
+for _ext, _type in _MIME_MAP.items():
+    _MIME_TYPES.add_type(_type, _ext)
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> Pattern[str]:
+    """Compile a user-supplied regex, caching the result."""
+    return re.compile(pattern)
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> Pattern[str]:
+    """
+    Compile a glob into a regex, caching the result.
+    
+    Matching is case-insensitive where the filesystem is, as fnmatch.fnmatch does.
+    """
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+def _regex_match(pattern: str, filename: str) -> bool:
+    """Check if the whole filename matches a regex."""
+    return _compile_regex(pattern).fullmatch(filename) is not None
+
+def _glob_match(pattern: str, filename: str) -> bool:
+    """Check if filename matches a glob."""
+    return _compile_glob(pattern).match(filename) is not None
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Stop a log QueueListener, flushing queued records, unless already stopped."""
+    if listener._thread is not None:
+        listener.stop()
+
+def _new_sha256():
+    """Create a SHA-256 hash object for non-security use."""
+    try:
+        return hashlib.sha256(usedforsecurity=False)
+    except TypeError:  # Python < 3.9
+        return hashlib.sha256()
 
-    @staticmethod
-    def setup_logging(config: Dict[str, Any]) -> logging.Logger:
+@functools.lru_cache(maxsize=256)
+def _mime_type_for_extension(ext: str) -> str:
+    """Look up the MIME type for a lowercased extension such as '.pdf'."""
+    mime_type, encoding = _MIME_TYPES.guess_type('file' + ext, strict=False)
+    # Compressed files such as .tar.gz are not of the inner type
+    if encoding:
+        return 'application/octet-stream'
+    return mime_type or 'application/octet-stream'
+
+def get_mime_type(filename: str) -> str:
+    """
+    Get the MIME type for a file based on its extension.
+
+    Only the last extension decides the type, so lookups are cached per
+    extension rather than per filename.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        str: MIME type of the file
+    """
+    return _mime_type_for_extension(os.path.splitext(filename)[1].lower())
+
+@functools.lru_cache(maxsize=512)
+def parse_schedule(schedule: str) -> int:
+    """
+    Parse schedule string into seconds.
+
+    Args:
+        schedule: Schedule string (e.g., "1h", "1d", "1w")
+
+    Returns:
+        int: Number of seconds
+    """
+    schedule = schedule.lower()
+
+    # Fast path for the plain "<digits><unit>" form, without the regex
+    value, unit = schedule[:-1], schedule[-1:]
+    if unit in _SCHEDULE_UNITS and value.isascii() and value.isdigit():
+        return int(value) * _SCHEDULE_UNITS[unit]
+
+    match = _SCHEDULE_RE.match(schedule)
+    if not match:
+        raise ValueError("Invalid schedule format. Use format like '1h', '1d', '1w'")
+
+    value, unit = match.groups()
+    return int(value) * _SCHEDULE_UNITS[unit]
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that buffers writes instead of flushing after every record.
+    
+    The buffer is flushed by a background thread every flush_interval seconds,
+    when it fills up, and when the handler is closed (logging.shutdown closes
+    all handlers at interpreter exit).
+    """
+
+    def __init__(self, filename: str, mode: str = 'a', encoding: Optional[str] = None,
+                 buffer_size: int = 1 << 16, flush_interval: float = 1.0):
         """
-        Set up logging configuration.
+        Initialize the handler.
         
         Args:
-            config: Configuration dictionary containing logging settings
-        
-        Returns:
-            logging.Logger: Configured logger instance
+            filename: Path to the log file
+            mode: File open mode
+            encoding: File encoding
+            buffer_size: Size of the write buffer in bytes
+            flush_interval: Seconds between periodic flushes
         """
-        log_config = config.get('logging', {})
-        log_file = log_config.get('file', 'audit.log')
-        log_level = getattr(logging, log_config.get('level', 'INFO'))
-        log_format = log_config.get('format', '%(asctime)s - %(levelname)s - %(message)s')
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        super().__init__(filename, mode, encoding)
 
-        # Create logger
-        logger = logging.getLogger('gdrive_tool')
-        logger.setLevel(log_level)
+        self._stop_flushing = threading.Event()
+        flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        flusher.start()
 
-        # Create handlers
-        file_handler = logging.FileHandler(log_file)
-        console_handler = logging.StreamHandler()
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding)
 
-        # Create formatters and add it to handlers
-        formatter = logging.Formatter(log_format)
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the buffered stream without flushing it."""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush_interval seconds until closed."""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop periodic flushing, then flush and close the file."""
+        self._stop_flushing.set()
+        super().close()
 
-        # Add handlers to the logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+def setup_logging(config: Dict[str, Any]) -> logging.Logger:
+    """
+    Set up logging configuration.
+    
+    Records are handed to a QueueListener thread that writes them out; call
+    logger._listener.stop() to flush before exiting early (this also runs
+    at interpreter exit).
+    
+    Args:
+        config: Configuration dictionary containing logging settings
+    
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    log_config = config.get('logging', {})
+    log_file = log_config.get('file', 'audit.log')
+    log_level = getattr(logging, log_config.get('level', 'INFO'))
+    log_format = log_config.get('format', '%(asctime)s - %(levelname)s - %(message)s')
 
+    # Create logger; configure it only once so repeated calls don't attach
+    # duplicate handlers
+    logger = logging.getLogger('gdrive_tool')
+    if getattr(logger, '_configured', False):
         return logger
+    logger.setLevel(log_level)
 
-    @staticmethod
-    def extract_file_id_from_url(url: str) -> Optional[str]:
-        """
-        Extract Google Drive file ID from various types of Google Drive URLs.
+    # Create handlers
+    file_handler = BufferedFileHandler(
+        log_file, flush_interval=log_config.get('flush_interval', 1.0))
+    console_handler = logging.StreamHandler()
+
+    # Create formatters and add it to handlers
+    formatter = logging.Formatter(log_format)
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+
+    # Write records from a background thread so callers never block on
+    # file or console I/O; stopping the listener flushes pending records
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler,
+                             respect_handler_level=True)
+    listener.start()
+    atexit.register(_stop_listener, listener)
+    logger._listener = listener
+
+    logger.addHandler(QueueHandler(log_queue))
+    # Don't emit records a second time through handlers on the root logger
+    logger.propagate = False
+    # Only mark the logger once its handlers are in place, so a failure above
+    # (e.g. an unwritable log file) is retried and not silently kept
+    logger._configured = True
+
+    return logger
+
+def extract_file_id_from_url(url: str) -> Optional[str]:
+    """
+    Extract Google Drive file ID from various types of Google Drive URLs.
+    
+    The raw URL string is matched directly; it is not parsed into
+    components first.
+    
+    Args:
+        url: Google Drive URL
         
-        Args:
-            url: Google Drive URL
-            
-        Returns:
-            str: File ID if found, None otherwise
-            
-        Examples:
-            >>> extract_file_id_from_url("https://drive.google.com/file/d/1234567890/view")
-            "1234567890"
-            >>> extract_file_id_from_url("https://drive.google.com/drive/folders/1234567890")
-            "1234567890"
-        """
-        patterns = [
-            r'/file/d/([a-zA-Z0-9_-]+)',
-            r'/folders/([a-zA-Z0-9_-]+)',
-            r'id=([a-zA-Z0-9_-]+)',
-            r'/drive/([a-zA-Z0-9_-]+)'
-        ]
-
-        parsed_url = urlparse(url)
+    Returns:
+        str: File ID if found, None otherwise
         
-        # Try to extract ID using patterns
-        for pattern in patterns:
-            match = re.search(pattern, parsed_url.path)
-            if match:
-                return match.group(1)
-
-        # Try to get ID from query parameters
-        query_params = parse_qs(parsed_url.query)
-        if 'id' in query_params:
-            return query_params['id'][0]
+    Examples:
+        >>> extract_file_id_from_url("https://drive.google.com/file/d/1234567890/view")
+        "1234567890"
+        >>> extract_file_id_from_url("https://drive.google.com/drive/folders/1234567890")
+        "1234567890"
+        >>> extract_file_id_from_url("https://drive.google.com/open?id=1234567890")
+        "1234567890"
+    """
+    # Cheap substring checks reject URLs that cannot match before the regex runs
+    if not any(marker in url for marker in _URL_MARKERS):
+        return None
 
+    match = _URL_ID_RE.match(url)
+    if not match:
         return None
+    return next(group for group in match.groups() if group)
 
-    @staticmethod
-    def compute_file_checksum(file_path: str, block_size: int = 65536) -> str:
-        """
-        Compute SHA-256 checksum of a file.
+def compute_file_checksum(file_path: str, block_size: int = 1 << 20,
+                          algo: str = 'sha256') -> str:
+    """
+    Compute checksum of a file (SHA-256 by default).
+    
+    The checksum only identifies file contents, so the hash is created with
+    usedforsecurity=False. hashlib's OpenSSL backend uses the CPU's SHA
+    extensions where available; large blocks keep the per-call overhead low.
+    
+    Args:
+        file_path: Path to the file
+        block_size: Size of blocks to read
+        algo: 'sha256', or 'crc32c' for a much faster integrity-only
+            checksum (see compute_file_crc32c)
         
-        Args:
-            file_path: Path to the file
-            block_size: Size of blocks to read
+    Returns:
+        str: Hexadecimal representation of the file's checksum
+    """
+    if algo == 'crc32c':
+        return compute_file_crc32c(file_path, block_size)
+    if algo != 'sha256':
+        raise ValueError(f"Unsupported checksum algorithm: {algo}")
+
+    sha256_hash = _new_sha256()
+
+    # Read into one reusable buffer instead of allocating a bytes object per block
+    buffer = memoryview(bytearray(block_size))
+    with open(file_path, "rb") as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            sha256_hash.update(buffer[:n])
             
-        Returns:
-            str: Hexadecimal representation of the file's SHA-256 hash
-        """
-        sha256_hash = hashlib.sha256()
+    return sha256_hash.hexdigest()
+
+def compute_file_checksum_parallel(file_path: str, threads: int = 4) -> str:
+    """
+    Compute a SHA-256 tree hash of a file using several threads.
+    
+    The file is memory-mapped and split into `threads` equal ranges that are
+    hashed concurrently (hashlib releases the GIL while hashing large
+    buffers). The result is the SHA-256 of the concatenated per-range
+    digests: it is NOT the file's plain SHA-256, and it only matches other
+    results of this function computed with the same number of threads.
+    
+    Args:
+        file_path: Path to the file
+        threads: Number of ranges to hash in parallel
         
-        with open(file_path, "rb") as f:
-            for block in iter(lambda: f.read(block_size), b""):
-                sha256_hash.update(block)
-                
-        return sha256_hash.hexdigest()
-
-    @staticmethod
-    def pattern_matches(filename: str, pattern: str) -> bool:
-        """
-        Check if filename matches the given pattern.
-        Supports both glob patterns and regex patterns.
+    Returns:
+        str: Hexadecimal representation of the tree hash
+    """
+    size = os.path.getsize(file_path)
+    tree_hash = _new_sha256()
+    if size == 0:
+        # Nothing to map; the tree hash of zero ranges
+        return tree_hash.hexdigest()
+
+    chunk_size = -(-size // max(1, threads))
+    with open(file_path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        def hash_range(start: int) -> bytes:
+            range_hash = _new_sha256()
+            with memoryview(mapped) as view:
+                range_hash.update(view[start:start + chunk_size])
+            return range_hash.digest()
+
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as pool:
+            digests = list(pool.map(hash_range, range(0, size, chunk_size)))
+
+    for digest in digests:
+        tree_hash.update(digest)
+    return tree_hash.hexdigest()
+
+def compute_file_crc32c(file_path: str, block_size: int = 1 << 20) -> str:
+    """
+    Compute CRC32C checksum of a file.
+    
+    Suitable for detecting transfer corruption or duplicates, not for
+    anything that needs collision resistance. google-crc32c uses the
+    CPU's hardware CRC instructions where available.
+    
+    Args:
+        file_path: Path to the file
+        block_size: Size of blocks to read
         
-        Args:
-            filename: Name of the file to check
-            pattern: Pattern to match against (glob or regex)
-            
-        Returns:
-            bool: True if filename matches the pattern, False otherwise
-        """
-        # Try regex first
-        try:
-            if pattern.startswith('r:'):
-                # Remove the 'r:' prefix for regex patterns
-                regex_pattern = pattern[2:]
-                return bool(re.match(regex_pattern, filename))
-        except re.error:
-            pass
-
-        # Fall back to glob pattern matching
-        return fnmatch.fnmatch(filename, pattern)
-
-    @staticmethod
-    def get_mime_type(filename: str) -> str:
-        """
-        Get the MIME type for a file based on its extension.
+    Returns:
+        str: Hexadecimal representation of the file's CRC32C
         
-        Args:
-            filename: Name of the file
-            
-        Returns:
-            str: MIME type of the file
-        """
-        extension_map = {
-            '.txt': 'text/plain',
-            '.pdf': 'application/pdf',
-            '.doc': 'application/msword',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.xls': 'application/vnd.ms-excel',
-            '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            '.ppt': 'application/vnd.ms-powerpoint',
-            '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.zip': 'application/zip',
-            '.mp3': 'audio/mpeg',
-            '.mp4': 'video/mp4',
-            '.json': 'application/json',
-            '.xml': 'application/xml',
-            '.html': 'text/html',
-            '.css': 'text/css',
-            '.js': 'application/javascript'
-        }
+    Raises:
+        ImportError: If the google-crc32c package is not installed
+    """
+    if google_crc32c is None:
+        raise ImportError("CRC32C checksums require the google-crc32c package")
+
+    checksum = google_crc32c.Checksum()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            checksum.update(block)
+
+    return checksum.hexdigest().decode('ascii')
+
+def compile_pattern(pattern: str) -> Pattern[str]:
+    """
+    Compile a filename pattern into a regular expression.
+    Supports both glob patterns and regex patterns (prefixed with 'r:').
+    
+    Args:
+        pattern: Pattern to compile (glob or regex)
+        
+    Returns:
+        Pattern[str]: Compiled pattern; use .fullmatch() to test a filename
         
-        ext = os.path.splitext(filename)[1].lower()
-        return extension_map.get(ext, 'application/octet-stream')
+    Raises:
+        re.error: If a regex pattern is invalid
+    """
+    if pattern.startswith('r:'):
+        # Remove the 'r:' prefix for regex patterns
+        return _compile_regex(pattern[2:])
+    return _compile_glob(pattern)
 
-    @staticmethod
-    def format_file_size(size_bytes: int) -> str:
-        """
-        Format file size in human-readable format.
+def pattern_matches(filename: str, pattern: str) -> bool:
+    """
+    Check if filename matches the given pattern.
+    Supports both glob patterns and regex patterns (prefixed with 'r:').
+    Like globs, regex patterns must match the whole filename.
+    
+    Args:
+        filename: Name of the file to check
+        pattern: Pattern to match against (glob or regex)
         
-        Args:
-            size_bytes: Size in bytes
-            
-        Returns:
-            str: Formatted size string (e.g., "1.23 MB")
-        """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.2f} PB"
-
-    @staticmethod
-    def is_valid_path(path: str) -> bool:
-        """
-        Validate if a path is safe and valid.
+    Returns:
+        bool: True if filename matches the pattern, False otherwise
         
-        Args:
-            path: Path to validate
-            
-        Returns:
-            bool: True if path is valid, False otherwise
-        """
-        try:
-            # Normalize path
-            normalized_path = os.path.normpath(path)
-            
-            # Check for path traversal attempts
-            if '..' in normalized_path.split(os.sep):
-                return False
-                
-            # Check if path is absolute
-            if os.path.isabs(normalized_path):
-                return False
-                
-            return True
-        except Exception:
-            return False
+    Raises:
+        re.error: If a regex pattern is invalid
+    """
+    if pattern.startswith('r:'):
+        return _regex_match(pattern[2:], filename)
+    return _glob_match(pattern, filename)
 
-    @staticmethod
-    def parse_schedule(schedule: str) -> int:
-        """
-        Parse schedule string into seconds.
+def format_file_size(size_bytes: int) -> str:
+    """
+    Format file size in human-readable format.
+    
+    Args:
+        size_bytes: Size in bytes
         
-        Args:
-            schedule: Schedule string (e.g., "1h", "1d", "1w")
-            
-        Returns:
-            int: Number of seconds
-        """
-        units = {
-            's': 1,
-            'm': 60,
-            'h': 3600,
-            'd': 86400,
-            'w': 604800
-        }
+    Returns:
+        str: Formatted size string (e.g., "1.23 MB")
+    """
+    # Each unit is 2**10 of the previous one, so the unit index is
+    # floor(log2(size) / 10), read directly off the integer's bit length
+    magnitude = int(size_bytes) if size_bytes > 0 else 0
+    idx = min(max(magnitude.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.2f} {_SIZE_UNITS[idx]}"
+
+def is_valid_path(path: Union[str, os.PathLike]) -> bool:
+    """
+    Validate if a path is safe and valid.
+    
+    Args:
+        path: Path to validate (a string or os.PathLike; bytes are rejected)
         
-        match = re.match(r'(\d+)([smhdw])', schedule.lower())
-        if not match:
-            raise ValueError("Invalid schedule format. Use format like '1h', '1d', '1w'")
-            
-        value, unit = match.groups()
-        return int(value) * units[unit]
+    Returns:
+        bool: True if path is valid, False otherwise
+    """
+    try:
+        path = os.fspath(path)
+        if isinstance(path, bytes):
+            return False
+        # Normalize path
+        normalized_path = os.path.normpath(path)
+    except (TypeError, ValueError):
+        return False
 
-    @staticmethod
-    def generate_backup_path(base_path: str, original_name: str) -> str:
-        """
-        Generate a backup path with timestamp.
+    # Check if path is absolute
+    if os.path.isabs(normalized_path) or normalized_path == '..':
+        return False
+
+    # Check for path traversal attempts directly on the normalized string,
+    # without building a separator-wrapped copy or splitting it
+    sep = os.sep
+    return not (normalized_path.startswith('..' + sep)
+                or (sep + '..' + sep) in normalized_path
+                or normalized_path.endswith(sep + '..'))
+
+def generate_backup_path(base_path: str, original_name: str) -> str:
+    """
+    Generate a backup path with timestamp.
+    
+    Args:
+        base_path: Base backup directory path
+        original_name: Original filename
         
-        Args:
-            base_path: Base backup directory path
-            original_name: Original filename
-            
-        Returns:
-            str: Backup path with timestamp
-        """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename, ext = os.path.splitext(original_name)
-        return os.path.join(base_path, f"{filename}_{timestamp}{ext}")
+    Returns:
+        str: Backup path with timestamp
+    """
+    timestamp = time.strftime('%Y%m%d_%H%M%S', time.localtime())
+    filename, ext = os.path.splitext(original_name)
+    return os.path.join(base_path, f"{filename}_{timestamp}{ext}")
+
+class DriveUtilities:
+    """
+    Utility functions for Google Drive operations.
+    
+    Kept as a namespace for backward compatibility; the functions are also
+    available at module level, which avoids the class attribute lookup.
+    """
+
+    setup_logging = staticmethod(setup_logging)
+    extract_file_id_from_url = staticmethod(extract_file_id_from_url)
+    compute_file_checksum = staticmethod(compute_file_checksum)
+    compute_file_checksum_parallel = staticmethod(compute_file_checksum_parallel)
+    compute_file_crc32c = staticmethod(compute_file_crc32c)
+    compile_pattern = staticmethod(compile_pattern)
+    pattern_matches = staticmethod(pattern_matches)
+    get_mime_type = staticmethod(get_mime_type)
+    format_file_size = staticmethod(format_file_size)
+    is_valid_path = staticmethod(is_valid_path)
+    parse_schedule = staticmethod(parse_schedule)
+    generate_backup_path = staticmethod(generate_backup_path)
 
 if __name__ == "__main__":
     # Example usage and testing
-    utils = DriveUtilities()
     
     # Test URL parsing
     test_url = "https://drive.google.com/file/d/1234567890/view"
-    file_id = utils.extract_file_id_from_url(test_url)
+    file_id = extract_file_id_from_url(test_url)
     print(f"Extracted file ID: {file_id}")
     
     # Test pattern matching
     filename = "document.txt"
     pattern = "*.txt"
-    matches = utils.pattern_matches(filename, pattern)
+    matches = pattern_matches(filename, pattern)
     print(f"Pattern match result: {matches}")
\ No newline at end of file